@@ -4,21 +4,33 @@ import argparse
 import concurrent.futures
 import csv
 import fnmatch
+import hashlib
+import io
 import json
 import logging
+import math
+import operator
 import os
 import re
 import sys
+import threading
 import time
-from collections import Counter
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlencode
 
 import requests
 from dotenv import load_dotenv
 from requests.auth import HTTPDigestAuth
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing and output
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 __version__ = "0.1.0"
@@ -31,6 +43,9 @@ class Config:
     max_workers: int = 20
     timeout: int = 30
     highlight_threshold: int = 30
+    cache_ttl: int = 300
+    cache_policy: str = "normal"
+    no_cache: bool = False
     no_color: bool = False
     force_color: bool = False
     quiet: bool = False
@@ -44,6 +59,28 @@ class Config:
         return ""
 
 
+@dataclass(slots=True, frozen=True)
+class ClusterRow:
+    """One report row; ``name`` is None for a project without clusters."""
+
+    project: str
+    name: str | None
+    tier: str = ""
+    tier_size: int = 0
+    cluster_type: str = ""
+    provider: str = ""
+    region: str = ""
+    version: str = ""
+    state: str = ""
+    pit: bool = False
+    disk: float = 0.0
+    is_large: bool = False
+
+
+class RetriesExhausted(Exception):
+    """Every attempt failed with a transient error (429, 5xx or network)."""
+
+
 load_dotenv()
 config = Config(
     items_per_page=int(os.getenv("ATLAS_ITEMS_PER_PAGE", "500")),
@@ -51,12 +88,26 @@ config = Config(
     max_workers=int(os.getenv("ATLAS_MAX_WORKERS", "20")),
     timeout=int(os.getenv("ATLAS_TIMEOUT", "30")),
     highlight_threshold=int(os.getenv("ATLAS_HIGHLIGHT_THRESHOLD", "30")),
+    cache_ttl=int(os.getenv("ATLAS_CACHE_TTL", "300")),
+    cache_policy=os.getenv("ATLAS_CACHE_POLICY", "normal"),
 )
 
 ATLAS_PUBLIC_KEY = os.getenv("ATLAS_PUBLIC_KEY")
 ATLAS_PRIVATE_KEY = os.getenv("ATLAS_PRIVATE_KEY")
 API_BASE = "https://cloud.mongodb.com/api/atlas/v1.0"
+CACHE_DIR = Path("~/.cache/atlas_report").expanduser()
+# Entries older than this are deleted, which also bounds stale-if-error reuse.
+CACHE_MAX_AGE = 24 * 3600
+# Per-endpoint TTL as a multiple of cache_ttl: the project list changes slowly,
+# cluster state changes while work is in progress.
+CACHE_POLICY = [
+    (re.compile(r"^/groups$"), 2.0),
+    (re.compile(r"^/groups/[^/]+/clusters$"), 0.2),
+]
+CACHE_POLICY_SCALE = {"short": 0.5, "normal": 1.0, "long": 4.0}
+TIER_RE = re.compile(r"M(\d+)")
 _session: requests.Session | None = None
+_slots: threading.BoundedSemaphore | None = None
 
 
 def get_session() -> requests.Session:
@@ -66,23 +117,126 @@ def get_session() -> requests.Session:
         _session.auth = HTTPDigestAuth(ATLAS_PUBLIC_KEY, ATLAS_PRIVATE_KEY)
         _session.mount(
             "https://",
-            requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20),
+            requests.adapters.HTTPAdapter(
+                pool_connections=config.max_workers, pool_maxsize=config.max_workers
+            ),
         )
     return _session
 
 
+def request_slots() -> threading.BoundedSemaphore:
+    """Process-wide cap of config.max_workers concurrent HTTP requests.
+
+    Project fetches and their page fetches run on separate pools, so the cap
+    lives here rather than in any one executor.
+    """
+    global _slots
+    if _slots is None:
+        _slots = threading.BoundedSemaphore(config.max_workers)
+    return _slots
+
+
+def cache_key(endpoint: str, params: dict | None) -> str:
+    q = urlencode(sorted((params or {}).items()))
+    raw = f"{ATLAS_PUBLIC_KEY}:{endpoint}?{q}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def cache_get(key: str, ttl: int | None) -> dict | None:
+    """Return cached response, or None if missing or older than ttl.
+
+    A ttl of None accepts any entry younger than CACHE_MAX_AGE (stale-if-error).
+    """
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age >= (CACHE_MAX_AGE if ttl is None else ttl):
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def cache_set(key: str, data: dict) -> None:
+    path = CACHE_DIR / f"{key}.json"
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        tmp.replace(path)
+    except OSError as e:
+        logger.debug("Cache write failed: %s", e)
+
+
+def prune_cache() -> None:
+    """Delete cache entries older than CACHE_MAX_AGE and leftover temp files."""
+    now = time.time()
+    try:
+        paths = list(CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in paths:
+        try:
+            if path.suffix == ".tmp" or now - path.stat().st_mtime >= CACHE_MAX_AGE:
+                path.unlink()
+            else:
+                path.chmod(0o600)
+        except OSError as e:
+            logger.debug("Cache prune failed for %s: %s", path, e)
+
+
+def cache_ttl_for(endpoint: str) -> int:
+    """TTL for an endpoint from CACHE_POLICY, scaled by --cache-policy."""
+    factor = next((f for pat, f in CACHE_POLICY if pat.match(endpoint)), 1.0)
+    scale = CACHE_POLICY_SCALE.get(config.cache_policy, 1.0)
+    return int(config.cache_ttl * factor * scale)
+
+
 def api_get(endpoint: str, params: dict | None = None) -> dict | None:
+    """GET request to Atlas API, served from the disk cache while fresh."""
+    key = None if config.no_cache else cache_key(endpoint, params)
+    if key is not None:
+        data = cache_get(key, cache_ttl_for(endpoint))
+        if data is not None:
+            return data
+    try:
+        data = _request(endpoint, params)
+    except RetriesExhausted:
+        # Stale-if-error only for transient failures, never for 4xx answers.
+        if key is None or (data := cache_get(key, None)) is None:
+            return None
+        logger.warning("Request failed; using stale cached response for %s", endpoint)
+        return data
+    if key is not None and data is not None:
+        cache_set(key, data)
+    return data
+
+
+def parse_json(r: requests.Response) -> dict:
+    """Decode a response body with orjson when installed, else with requests."""
+    if orjson is not None:
+        try:
+            return orjson.loads(r.content)
+        except orjson.JSONDecodeError:
+            pass  # fall through so requests raises its usual decode error
+    return r.json()
+
+
+def _request(endpoint: str, params: dict | None = None) -> dict | None:
     """GET request to Atlas API with retry."""
     backoff = 1
     for attempt in range(config.max_attempts):
         try:
-            r = get_session().get(
-                f"{API_BASE}{endpoint}", params=params, timeout=config.timeout
-            )
+            with request_slots():
+                r = get_session().get(
+                    f"{API_BASE}{endpoint}", params=params, timeout=config.timeout
+                )
             r.raise_for_status()
-            return r.json()
+            return parse_json(r)
         except requests.exceptions.HTTPError as e:
-            status = e.response.status_code if e.response else None
+            status = e.response.status_code if e.response is not None else None
             if (
                 status in {429, 500, 502, 503, 504}
                 and attempt < config.max_attempts - 1
@@ -94,8 +248,10 @@ def api_get(endpoint: str, params: dict | None = None) -> dict | None:
                 backoff *= 2
                 continue
             logger.error("HTTP Error: %s", e)
-            if e.response is not None:
-                logger.error("Response: %s", e.response.text)
+            if e.response is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response: %s", e.response.text)
+            if status in {429, 500, 502, 503, 504}:
+                raise RetriesExhausted(endpoint) from e
             return None
         except requests.exceptions.RequestException as e:
             if attempt < config.max_attempts - 1:
@@ -104,49 +260,110 @@ def api_get(endpoint: str, params: dict | None = None) -> dict | None:
                 backoff *= 2
                 continue
             logger.error("Request Error: %s", e)
-            return None
+            raise RetriesExhausted(endpoint) from e
     return None
 
 
-def api_get_all(endpoint: str, params: dict | None = None) -> list[dict]:
-    """Fetch all pages from paginated endpoint."""
-    results, page = [], 1
-    base = params.copy() if params else {}
-    while True:
-        data = api_get(
-            endpoint, {**base, "pageNum": page, "itemsPerPage": config.items_per_page}
+def api_get_pages(
+    endpoint: str,
+    params: dict | None = None,
+    ex: concurrent.futures.Executor | None = None,
+):
+    """Yield (page_num, results) for each page of a paginated endpoint.
+
+    Page 1 is fetched synchronously; once totalCount is known, pages 2..N are
+    submitted to ``ex`` (a private pool when None) before page 1 is yielded, so
+    work the caller queues for page 1 runs behind them. Later pages are
+    yielded as they complete.
+    """
+    base = {**(params or {}), "itemsPerPage": config.items_per_page}
+    data = api_get(endpoint, {**base, "pageNum": 1})
+    if not data or "results" not in data:
+        return
+    # Without totalCount the page count is unknown; stop after page 1 as before.
+    total_pages = (
+        math.ceil(data["totalCount"] / config.items_per_page)
+        if data["results"] and "totalCount" in data
+        else 1
+    )
+    if total_pages <= 1:
+        yield 1, data["results"]
+        return
+
+    own = ex is None
+    if own:
+        ex = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(config.max_workers, total_pages - 1)
         )
-        if not data or "results" not in data:
-            break
-        results.extend(data["results"])
-        if (
-            not data["results"]
-            or len(results) >= data.get("totalCount", 0)
-            or len(data["results"]) < config.items_per_page
-        ):
-            break
-        page += 1
-    return results
+    try:
+        futs = {
+            ex.submit(api_get, endpoint, {**base, "pageNum": page}): page
+            for page in range(2, total_pages + 1)
+        }
+        yield 1, data["results"]
+        for f in concurrent.futures.as_completed(futs):
+            data = f.result()
+            if data and "results" in data:
+                yield futs[f], data["results"]
+    finally:
+        if own:
+            ex.shutdown()
+
+
+def api_get_all(endpoint: str, params: dict | None = None) -> list[dict]:
+    """Fetch all pages from paginated endpoint; pages 2..N are fetched concurrently."""
+    pages = dict(api_get_pages(endpoint, params))
+    return [item for page in sorted(pages) for item in pages[page]]
+
+
+def fetch_project_clusters(p: dict) -> dict:
+    return {
+        "project_name": p["name"],
+        "clusters": api_get_all(f"/groups/{p['id']}/clusters"),
+    }
+
+
+@lru_cache(maxsize=8)
+def compile_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile glob patterns into one case-insensitive regex alternation."""
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), re.IGNORECASE
+    )
+
+
+def drain(inflight: dict, reports: list[dict], block: bool = True) -> int:
+    """Move finished project fetches from inflight into reports.
+
+    With ``block`` it waits for at least one fetch to finish; otherwise it only
+    collects those already done. Returns the number of finished fetches,
+    failed ones included.
+    """
+    finished, _ = concurrent.futures.wait(
+        inflight,
+        timeout=None if block else 0,
+        return_when=concurrent.futures.FIRST_COMPLETED,
+    )
+    for f in finished:
+        p = inflight.pop(f)
+        try:
+            reports.append(f.result())
+        except Exception as e:
+            logger.error("Failed '%s': %s", p.get("name"), e)
+    return len(finished)
 
 
 def filter_projects(projects: list[dict]) -> list[dict]:
     if not config.include_projects and not config.exclude_projects:
         return projects
-
-    def match(name: str, patterns: list[str]) -> bool:
-        return any(fnmatch.fnmatch(name.lower(), p.lower()) for p in patterns)
-
+    inc, exc = (
+        compile_patterns(tuple(pats)) if pats else None
+        for pats in (config.include_projects, config.exclude_projects)
+    )
     return [
         p
         for p in projects
-        if (
-            not config.include_projects
-            or match(p.get("name", ""), config.include_projects)
-        )
-        and not (
-            config.exclude_projects
-            and match(p.get("name", ""), config.exclude_projects)
-        )
+        if (inc is None or inc.match(p.get("name", "")))
+        and not (exc is not None and exc.match(p.get("name", "")))
     ]
 
 
@@ -156,8 +373,14 @@ def get_tier(c: dict) -> str:
     return c.get("providerSettings", {}).get("instanceSizeName", "N/A")
 
 
+def tier_size(tier: str) -> int:
+    """Numeric size of an M-series tier (M30 -> 30); 0 for anything else."""
+    m = TIER_RE.match(tier)
+    return int(m.group(1)) if m else 0
+
+
 def is_large_tier(tier: str) -> bool:
-    m = re.match(r"M(\d+)", tier)
+    m = TIER_RE.match(tier)
     return m is not None and int(m.group(1)) > config.highlight_threshold
 
 
@@ -206,6 +429,22 @@ Examples:
         default=config.highlight_threshold,
         help=f"highlight tiers larger than M{{N}} in red (default: {config.highlight_threshold})",
     )
+    p.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=config.cache_ttl,
+        help=f"base seconds to reuse cached API responses (default: {config.cache_ttl})",
+    )
+    p.add_argument(
+        "--cache-policy",
+        choices=list(CACHE_POLICY_SCALE),
+        default=config.cache_policy,
+        help="scale per-endpoint cache TTLs: short, normal or long "
+        f"(default: {config.cache_policy})",
+    )
+    p.add_argument(
+        "--no-cache", action="store_true", help="bypass the on-disk response cache"
+    )
     p.add_argument("--no-color", action="store_true", help="disable colored output")
     p.add_argument(
         "--force-color", action="store_true", help="force colored output (ignore TTY)"
@@ -258,8 +497,12 @@ def validate_args(args):
     ]:
         if val < min_val:
             errs.append(f"--{name} must be >= {min_val}")
-    if args.highlight_threshold < 0:
-        errs.append("--highlight-threshold must be >= 0")
+    for name, val in [
+        ("highlight-threshold", args.highlight_threshold),
+        ("cache-ttl", args.cache_ttl),
+    ]:
+        if val < 0:
+            errs.append(f"--{name} must be >= 0")
     if errs:
         for e in errs:
             print(f"Error: {e}", file=sys.stderr)
@@ -275,71 +518,129 @@ def infer_format(path: Path, explicit: str | None) -> str:
     return fmt
 
 
-def export_report(reports: list[dict], path: Path, fmt: str) -> None:
+def flatten_reports(reports: list[dict]) -> list[ClusterRow]:
+    """Flatten reports into one row per cluster, ordered by project name."""
+    rows = []
+    for r in sorted(reports, key=operator.itemgetter("project_name")):
+        name = sys.intern(r["project_name"])
+        if not r.get("clusters"):
+            rows.append(ClusterRow(name, None))
+            continue
+        for c in r["clusters"]:
+            t, ps = get_tier(c), c.get("providerSettings", {})
+            rows.append(
+                ClusterRow(
+                    project=name,
+                    name=c.get("name", ""),
+                    tier=t,
+                    tier_size=tier_size(t),
+                    cluster_type=c.get("clusterType", ""),
+                    provider=ps.get("providerName", "N/A"),
+                    region=ps.get("regionName", "N/A"),
+                    version=c.get("mongoDBMajorVersion", "N/A"),
+                    state=c.get("stateName", "N/A"),
+                    pit=bool(c.get("pitEnabled")),
+                    disk=c.get("diskSizeGB", 0.0),
+                    is_large=is_large_tier(t),
+                )
+            )
+    return rows
+
+
+CSV_FIELDS = [
+    "generated_at",
+    "project_name",
+    "cluster_name",
+    "tier",
+    "cluster_type",
+    "provider",
+    "region",
+    "version",
+    "state",
+    "pit",
+    "disk_size_gb",
+]
+
+
+def iter_csv_rows(rows: list[ClusterRow], ts: str):
+    """Yield one CSV dict per report row."""
+    for row in rows:
+        if row.name is None:
+            yield dict.fromkeys(CSV_FIELDS, "") | {
+                "generated_at": ts,
+                "project_name": row.project,
+            }
+        else:
+            yield {
+                "generated_at": ts,
+                "project_name": row.project,
+                "cluster_name": row.name,
+                "tier": row.tier,
+                "cluster_type": row.cluster_type,
+                "provider": row.provider,
+                "region": row.region,
+                "version": row.version,
+                "state": row.state,
+                "pit": "Yes" if row.pit else "No",
+                "disk_size_gb": row.disk,
+            }
+
+
+def write_json(doc: dict, f: io.BufferedIOBase) -> None:
+    """Write doc as indented JSON to a binary stream, using orjson when installed."""
+    if orjson is not None:
+        f.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2))
+        return
+    w = io.TextIOWrapper(f, encoding="utf-8", write_through=True)
+    json.dump(doc, w, indent=2)
+    w.detach()
+
+
+def export_report(
+    reports: list[dict], path: Path, fmt: str, rows: list[ClusterRow] | None = None
+) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     ts = datetime.now(timezone.utc).isoformat()
-    sorted_reps = sorted(reports, key=lambda x: x["project_name"])
 
     if fmt == "json":
-        path.write_text(
-            json.dumps({"generated_at": ts, "projects": sorted_reps}, indent=2),
-            encoding="utf-8",
-        )
+        sorted_reps = sorted(reports, key=operator.itemgetter("project_name"))
+        with path.open("wb", buffering=1024 * 1024) as f:
+            write_json({"generated_at": ts, "projects": sorted_reps}, f)
         logger.info("Exported to %s (JSON)", path)
         return
 
-    fields = [
-        "generated_at",
-        "project_name",
-        "cluster_name",
-        "tier",
-        "cluster_type",
-        "provider",
-        "region",
-        "version",
-        "state",
-        "pit",
-        "disk_size_gb",
-    ]
-    rows = []
-    for r in sorted_reps:
-        if not r.get("clusters"):
-            rows.append(
-                {
-                    f: (
-                        ts
-                        if f == "generated_at"
-                        else r["project_name"] if f == "project_name" else ""
-                    )
-                    for f in fields
-                }
-            )
-        else:
-            for c in r["clusters"]:
-                ps = c.get("providerSettings", {})
-                rows.append(
-                    {
-                        "generated_at": ts,
-                        "project_name": r["project_name"],
-                        "cluster_name": c.get("name", ""),
-                        "tier": get_tier(c),
-                        "cluster_type": c.get("clusterType", ""),
-                        "provider": ps.get("providerName", "N/A"),
-                        "region": ps.get("regionName", "N/A"),
-                        "version": c.get("mongoDBMajorVersion", "N/A"),
-                        "state": c.get("stateName", "N/A"),
-                        "pit": "Yes" if c.get("pitEnabled") else "No",
-                        "disk_size_gb": c.get("diskSizeGB", 0.0),
-                    }
-                )
-    with path.open("w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
+    if rows is None:
+        rows = flatten_reports(reports)
+    with path.open("w", newline="", buffering=1024 * 1024) as f:
+        w = csv.DictWriter(f, fieldnames=CSV_FIELDS)
         w.writeheader()
-        w.writerows(rows)
+        w.writerows(iter_csv_rows(rows, ts))
     logger.info("Exported to %s (CSV)", path)
 
 
-def print_report(reports: list[dict]) -> None:
+def sort_rows(rows: list[ClusterRow]) -> None:
+    """Sort rows in place by config.sort_by (disk largest first).
+
+    The sort is stable, so rows from flatten_reports stay in project order
+    within equal keys.
+    """
+    by = config.sort_by
+    if by in ("tier", "disk"):
+        key = operator.attrgetter("tier_size" if by == "tier" else "disk")
+        rows.sort(key=key, reverse=by == "disk")
+        return
+    attr = {"cluster": "name", "provider": "provider", "region": "region"}.get(
+        by, "project"
+    )
+
+    def skey(row):
+        v = getattr(row, attr)
+        return "no clusters" if v is None else v.lower()
+
+    rows.sort(key=skey)
+
+
+def print_report(rows: list[ClusterRow]) -> None:
     red, reset = config.color("\x1b[91m"), config.color("\x1b[0m")
     hdrs = [
         "Project",
@@ -353,84 +654,74 @@ def print_report(reports: list[dict]) -> None:
         "PIT",
         "Disk GB",
     ]
-    rows = []
-    for r in sorted(reports, key=lambda x: x["project_name"]):
-        if not r.get("clusters"):
-            rows.append(([r["project_name"], "No clusters"] + [""] * 8, False))
-        else:
-            for c in r["clusters"]:
-                t, ps = get_tier(c), c.get("providerSettings", {})
-                rows.append(
-                    (
-                        [
-                            r["project_name"],
-                            c.get("name", ""),
-                            t,
-                            c.get("clusterType", ""),
-                            ps.get("providerName", "N/A"),
-                            ps.get("regionName", "N/A"),
-                            c.get("mongoDBMajorVersion", "N/A"),
-                            c.get("stateName", "N/A"),
-                            "Yes" if c.get("pitEnabled") else "No",
-                            f"{c.get('diskSizeGB', 0.0):.1f}",
-                        ],
-                        is_large_tier(t),
-                    )
-                )
-
-    # Sort
-    idx = {
-        "project": 0,
-        "cluster": 1,
-        "tier": 2,
-        "provider": 4,
-        "region": 5,
-        "disk": 9,
-    }.get(config.sort_by, 0)
 
-    def skey(row):
-        v = row[0][idx]
-        if idx == 9:
-            return (float(v or 0),)
-        if idx == 2:
-            m = re.match(r"M(\d+)", v)
-            return (int(m.group(1)) if m else 0,)
-        return (v.lower(),)
-
-    rows.sort(key=skey, reverse=(config.sort_by == "disk"))
+    lines = [
+        (
+            (
+                [row.project, "No clusters"] + [""] * 8
+                if row.name is None
+                else [
+                    row.project,
+                    row.name,
+                    row.tier,
+                    row.cluster_type,
+                    row.provider,
+                    row.region,
+                    row.version,
+                    row.state,
+                    "Yes" if row.pit else "No",
+                    f"{row.disk:.1f}",
+                ]
+            ),
+            row.is_large,
+        )
+        for row in rows
+    ]
 
-    widths = [max(len(h), *(len(r[0][i]) for r in rows)) for i, h in enumerate(hdrs)]
+    widths = [len(h) for h in hdrs]
+    for vals, _ in lines:
+        for i, v in enumerate(vals):
+            widths[i] = max(widths[i], len(v))
     sep, w = " | ", sum(widths) + 3 * (len(widths) - 1)
 
     def fmt(v):
         return sep.join(f"{v[i]:<{widths[i]}}" for i in range(len(v)))
 
-    print("\n" + "=" * w)
-    print(fmt(hdrs))
-    print("-" * w)
-    for vals, hl in rows:
+    out = ["", "=" * w, fmt(hdrs), "-" * w]
+    for vals, hl in lines:
         ln = fmt(vals)
-        print(f"{red}{ln}{reset}" if hl else ln)
-    print("=" * w)
-
-
-def print_summary(reports: list[dict]) -> None:
-    clusters = [c for r in reports for c in r.get("clusters", [])]
-    tiers = Counter(get_tier(c) for c in clusters)
-    provs = Counter(
-        c.get("providerSettings", {}).get("providerName", "N/A") for c in clusters
-    )
-    types = Counter(c.get("clusterType", "N/A") for c in clusters)
-    disk = sum(c.get("diskSizeGB", 0.0) for c in clusters)
+        out.append(f"{red}{ln}{reset}" if hl else ln)
+    out.append("=" * w)
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+
+
+def _ranked(c: Counter) -> str:
+    """Counts high to low, ties by key, so row order (--sort-by) has no effect."""
+    items = sorted(c.items(), key=lambda kv: (-kv[1], str(kv[0])))
+    return ", ".join(f"{k}:{v}" for k, v in items)
+
+
+def print_summary(rows: list[ClusterRow], projects: int) -> None:
+    tiers, provs, types = Counter(), Counter(), Counter()
+    clusters, disk = 0, 0.0
+    for r in rows:
+        if r.name is None:
+            continue
+        clusters += 1
+        tiers[r.tier] += 1
+        provs[r.provider] += 1
+        types[r.cluster_type or "N/A"] += 1
+        disk += r.disk
     print(
-        f"\n📈 Summary:\n   Projects: {len(reports)}  |  Clusters: {len(clusters)}  |  Disk: {disk:,.1f} GB"
+        f"\n📈 Summary:\n   Projects: {projects}  |  Clusters: {clusters}  |  Disk: {disk:,.1f} GB"
     )
     if tiers:
-        print(f"   Tiers: {', '.join(f'{k}:{v}' for k, v in tiers.most_common())}")
+        print(f"   Tiers: {_ranked(tiers)}")
     if provs:
-        print(f"   Providers: {', '.join(f'{k}:{v}' for k, v in provs.most_common())}")
+        print(f"   Providers: {_ranked(provs)}")
     if types:
-        print(f"   Types: {', '.join(f'{k}:{v}' for k, v in types.most_common())}")
+        print(f"   Types: {_ranked(types)}")
 
 
 def main() -> None:
@@ -446,6 +737,9 @@ def main() -> None:
         "max_workers",
         "timeout",
         "highlight_threshold",
+        "cache_ttl",
+        "cache_policy",
+        "no_cache",
         "no_color",
         "force_color",
         "quiet",
@@ -456,6 +750,8 @@ def main() -> None:
         args.project,
         args.exclude_project,
     )
+    if not config.no_cache:
+        prune_cache()
     if config.quiet:
         logger.setLevel(logging.WARNING)
 
@@ -463,43 +759,48 @@ def main() -> None:
         logger.error("FATAL: Set ATLAS_PUBLIC_KEY and ATLAS_PRIVATE_KEY in .env")
         sys.exit(1)
 
-    # Fetch projects
+    # Fetch projects, starting cluster fetches as each page of projects arrives
     t1 = time.perf_counter()
     logger.info("Fetching projects...")
-    projects = api_get_all("/groups")
-    if not projects:
-        logger.error("No projects found.")
-        sys.exit(1)
-    logger.info("Found %d projects.", len(projects))
-    projects = filter_projects(projects)
-    if not projects:
-        logger.error("No projects match filters.")
-        sys.exit(1)
-    if config.include_projects or config.exclude_projects:
-        logger.info("After filtering: %d projects.", len(projects))
-    proj_time = time.perf_counter() - t1
-
-    # Fetch clusters
-    t2 = time.perf_counter()
-    reports = []
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=min(config.max_workers, len(projects))
-    ) as ex:
-        futs = {
-            ex.submit(
-                lambda p: {
-                    "project_name": p["name"],
-                    "clusters": api_get_all(f"/groups/{p['id']}/clusters"),
-                },
-                p,
-            ): p
-            for p in projects
-        }
-        for f in concurrent.futures.as_completed(futs):
-            try:
-                reports.append(f.result())
-            except Exception as e:
-                logger.error("Failed '%s': %s", futs[f].get("name"), e)
+    reports, inflight, found, queued, done = [], {}, 0, 0, 0
+    backlog: deque[dict] = deque()
+    limit = config.max_workers * 2
+    with concurrent.futures.ThreadPoolExecutor(max_workers=config.max_workers) as ex:
+
+        def top_up():
+            while backlog and len(inflight) < limit:
+                p = backlog.popleft()
+                inflight[ex.submit(fetch_project_clusters, p)] = p
+
+        # Listing never waits on cluster fetches: projects beyond the in-flight
+        # limit are parked in the backlog until earlier fetches finish.
+        for _, page in api_get_pages("/groups", ex=ex):
+            found += len(page)
+            projects = filter_projects(page)
+            backlog.extend(projects)
+            queued += len(projects)
+            done += drain(inflight, reports, block=False)
+            top_up()
+        if not found:
+            logger.error("No projects found.")
+            sys.exit(1)
+        logger.info("Found %d projects.", found)
+        if not queued:
+            logger.error("No projects match filters.")
+            sys.exit(1)
+        if config.include_projects or config.exclude_projects:
+            logger.info("After filtering: %d projects.", queued)
+        proj_time = time.perf_counter() - t1
+
+        # Fetch clusters
+        t2 = time.perf_counter()
+        decile = done * 10 // queued
+        while inflight:
+            done += drain(inflight, reports)
+            top_up()
+            if done * 10 // queued > decile:
+                decile = done * 10 // queued
+                logger.info("Processed %d/%d projects", done, queued)
     clust_time = time.perf_counter() - t2
     total_clusters = sum(len(r.get("clusters", [])) for r in reports)
 
@@ -507,18 +808,23 @@ def main() -> None:
     if args.output_format == "json" and not args.output:
         ts = datetime.now(timezone.utc).isoformat()
         sorted_reps = sorted(reports, key=lambda x: x["project_name"])
-        print(json.dumps({"generated_at": ts, "projects": sorted_reps}, indent=2))
+        sys.stdout.flush()
+        write_json({"generated_at": ts, "projects": sorted_reps}, sys.stdout.buffer)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
         return
 
-    print_report(reports)
-    print_summary(reports)
+    rows = flatten_reports(reports)
+    sort_rows(rows)
+    print_report(rows)
+    print_summary(rows, len(reports))
 
     exp_time = 0.0
     if args.output:
         t3 = time.perf_counter()
         path = Path(args.output).expanduser().resolve()
         try:
-            export_report(reports, path, infer_format(path, args.output_format))
+            export_report(reports, path, infer_format(path, args.output_format), rows)
         except ValueError as e:
             logger.error("Output error: %s", e)
             sys.exit(1)
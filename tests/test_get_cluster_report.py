@@ -1,25 +1,69 @@
 import argparse
+import concurrent.futures
+import io
 import json
+import os
+import logging
+import threading
+import time
 import pytest
 from unittest.mock import MagicMock
 from pathlib import Path
 import requests
 from get_cluster_report import (
     api_get,
+    cache_get,
+    cache_key,
+    cache_set,
+    prune_cache,
+    cache_ttl_for,
+    drain,
     api_get_all,
+    api_get_pages,
     get_tier,
+    print_report,
+    print_summary,
     is_large_tier,
+    tier_size,
     infer_format,
+    main,
     validate_args,
     export_report,
+    fetch_project_clusters,
     filter_projects,
+    flatten_reports,
+    get_session,
+    parse_json,
+    sort_rows,
+    write_json,
+    ClusterRow,
     Config,
 )
 
 
+def json_response(data):
+    resp = MagicMock()
+    resp.content = json.dumps(data).encode()
+    resp.json.return_value = data
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, mocker):
+    path = tmp_path / "cache"
+    mocker.patch("get_cluster_report.CACHE_DIR", path)
+    return path
+
+
+def test_get_session_pool_matches_workers(mocker):
+    mocker.patch("get_cluster_report.config", Config(max_workers=50))
+    mocker.patch("get_cluster_report._session", None)
+    adapter = get_session().get_adapter("https://cloud.mongodb.com")
+    assert adapter._pool_maxsize == 50
+
+
 def test_api_get_success(mocker):
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": [{"id": "1", "name": "Test"}]}
+    mock_response = json_response({"results": [{"id": "1", "name": "Test"}]})
     mock_session = MagicMock()
     mock_session.get.return_value = mock_response
     mocker.patch("get_cluster_report.get_session", return_value=mock_session)
@@ -29,6 +73,24 @@ def test_api_get_success(mocker):
     assert data["results"][0]["name"] == "Test"
 
 
+class TestParseJson:
+    def test_orjson(self):
+        pytest.importorskip("orjson")
+        assert parse_json(json_response({"a": [1]})) == {"a": [1]}
+
+    def test_stdlib_fallback(self, mocker):
+        mocker.patch("get_cluster_report.orjson", None)
+        resp = MagicMock(content=b"not json")
+        resp.json.return_value = {"a": 1}
+        assert parse_json(resp) == {"a": 1}
+
+    def test_invalid_body_defers_to_requests(self):
+        resp = MagicMock(content=b"<html>")
+        resp.json.side_effect = requests.exceptions.JSONDecodeError("bad", "", 0)
+        with pytest.raises(requests.exceptions.RequestException):
+            parse_json(resp)
+
+
 def test_api_get_http_error(mocker):
     err = requests.exceptions.HTTPError("HTTP Error")
     err.response = MagicMock(status_code=404, text="Not found")
@@ -48,8 +110,7 @@ def test_api_get_retries_on_429(mocker):
 
     fail_resp = MagicMock()
     fail_resp.raise_for_status.side_effect = err
-    ok_resp = MagicMock()
-    ok_resp.json.return_value = {"ok": True}
+    ok_resp = json_response({"ok": True})
 
     mock_session = MagicMock()
     mock_session.get.side_effect = [fail_resp, ok_resp]
@@ -59,6 +120,58 @@ def test_api_get_retries_on_429(mocker):
     assert api_get("/test") == {"ok": True}
 
 
+def test_api_get_retries_with_real_error_response(mocker):
+    # requests.Response is falsy for 4xx/5xx, so status must not rely on truthiness
+    mocker.patch("get_cluster_report.config", Config(max_attempts=2))
+    mocker.patch("time.sleep")
+    resp = requests.Response()
+    resp.status_code = 503
+    err = requests.exceptions.HTTPError("Unavailable", response=resp)
+
+    fail_resp = MagicMock()
+    fail_resp.raise_for_status.side_effect = err
+    ok_resp = json_response({"ok": True})
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [fail_resp, ok_resp]
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    assert api_get("/test") == {"ok": True}
+
+
+def test_api_get_skips_response_body_unless_debug(mocker):
+    mocker.patch("get_cluster_report.config", Config(no_cache=True))
+    body = mocker.PropertyMock(return_value="Not found")
+    response = MagicMock(status_code=404)
+    type(response).text = body
+    err = requests.exceptions.HTTPError("HTTP Error")
+    err.response = response
+    mock_response = MagicMock()
+    mock_response.raise_for_status.side_effect = err
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    assert api_get("/test") is None
+    body.assert_not_called()
+
+
+def test_api_get_logs_response_body_at_debug(mocker, caplog):
+    mocker.patch("get_cluster_report.config", Config(no_cache=True))
+    response = MagicMock(status_code=404, text="Not found")
+    err = requests.exceptions.HTTPError("HTTP Error")
+    err.response = response
+    mock_response = MagicMock()
+    mock_response.raise_for_status.side_effect = err
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    with caplog.at_level(logging.DEBUG, logger="get_cluster_report"):
+        assert api_get("/test") is None
+    assert "Response: Not found" in caplog.text
+
+
 def test_api_get_respects_retry_after(mocker):
     mocker.patch("get_cluster_report.config", Config(max_attempts=2))
     sleep_mock = mocker.patch("time.sleep")
@@ -67,8 +180,7 @@ def test_api_get_respects_retry_after(mocker):
 
     fail_resp = MagicMock()
     fail_resp.raise_for_status.side_effect = err
-    ok_resp = MagicMock()
-    ok_resp.json.return_value = {"ok": True}
+    ok_resp = json_response({"ok": True})
 
     mock_session = MagicMock()
     mock_session.get.side_effect = [fail_resp, ok_resp]
@@ -78,12 +190,128 @@ def test_api_get_respects_retry_after(mocker):
     sleep_mock.assert_called_once_with(60)
 
 
-def test_api_get_all_single_page(mocker):
+def test_api_get_uses_cache(mocker):
+    mock_response = json_response({"ok": True})
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    assert api_get("/test", {"a": 1}) == {"ok": True}
+    assert api_get("/test", {"a": 1}) == {"ok": True}
+    assert mock_session.get.call_count == 1
+
+
+def test_api_get_no_cache(mocker):
+    mocker.patch("get_cluster_report.config", Config(no_cache=True))
+    mock_response = json_response({"ok": True})
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    api_get("/test")
+    api_get("/test")
+    assert mock_session.get.call_count == 2
+
+
+def test_api_get_stale_if_error(mocker):
+    mocker.patch("get_cluster_report.config", Config(cache_ttl=0, max_attempts=2))
+    mocker.patch("time.sleep")
+    cache_set(cache_key("/test", None), {"stale": True})
+    err = requests.exceptions.HTTPError("HTTP Error")
+    err.response = MagicMock(status_code=503, text="Unavailable", headers={})
     mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "results": [{"id": "1"}, {"id": "2"}],
-        "totalCount": 2,
-    }
+    mock_response.raise_for_status.side_effect = err
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    assert api_get("/test") == {"stale": True}
+    assert mock_session.get.call_count == 2
+
+
+def test_api_get_network_error_uses_stale(mocker):
+    mocker.patch("get_cluster_report.config", Config(cache_ttl=0, max_attempts=1))
+    cache_set(cache_key("/test", None), {"stale": True})
+    mock_session = MagicMock()
+    mock_session.get.side_effect = requests.exceptions.ConnectionError("down")
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    assert api_get("/test") == {"stale": True}
+
+
+def test_api_get_no_stale_on_client_error(mocker):
+    mocker.patch("get_cluster_report.config", Config(cache_ttl=0))
+    cache_set(cache_key("/test", None), {"stale": True})
+    err = requests.exceptions.HTTPError("HTTP Error")
+    err.response = MagicMock(status_code=401, text="Unauthorized")
+    mock_response = MagicMock()
+    mock_response.raise_for_status.side_effect = err
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    assert api_get("/test") is None
+
+
+def test_api_get_exhausted_without_cache_returns_none(mocker):
+    mocker.patch("get_cluster_report.config", Config(no_cache=True, max_attempts=1))
+    mock_session = MagicMock()
+    mock_session.get.side_effect = requests.exceptions.ConnectionError("down")
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    assert api_get("/test") is None
+
+
+class TestDiskCache:
+    def test_entries_private(self, cache_dir):
+        cache_set("k", {"a": 1})
+        assert (cache_dir / "k.json").stat().st_mode & 0o777 == 0o600
+        assert cache_get("k", 60) == {"a": 1}
+
+    def test_stale_bounded_by_max_age(self, cache_dir):
+        cache_set("k", {"a": 1})
+        old = os.path.getmtime(cache_dir / "k.json") - 2 * 24 * 3600
+        os.utime(cache_dir / "k.json", (old, old))
+        assert cache_get("k", None) is None
+
+    def test_prune(self, cache_dir):
+        cache_set("fresh", {"a": 1})
+        cache_set("old", {"a": 2})
+        (cache_dir / "fresh.json").chmod(0o644)
+        (cache_dir / "leftover.1.2.tmp").write_text("{}")
+        old = os.path.getmtime(cache_dir / "old.json") - 2 * 24 * 3600
+        os.utime(cache_dir / "old.json", (old, old))
+        prune_cache()
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["fresh.json"]
+        assert (cache_dir / "fresh.json").stat().st_mode & 0o777 == 0o600
+
+    def test_prune_missing_dir(self, cache_dir):
+        prune_cache()
+        assert not cache_dir.exists()
+
+
+class TestCacheTtlFor:
+    def test_endpoints(self, mocker):
+        mocker.patch("get_cluster_report.config", Config(cache_ttl=300))
+        assert cache_ttl_for("/groups") == 600
+        assert cache_ttl_for("/groups/abc/clusters") == 60
+        assert cache_ttl_for("/orgs") == 300
+
+    def test_policy_scale(self, mocker):
+        mocker.patch(
+            "get_cluster_report.config", Config(cache_ttl=300, cache_policy="short")
+        )
+        assert cache_ttl_for("/groups") == 300
+        assert cache_ttl_for("/groups/abc/clusters") == 30
+
+
+def test_api_get_all_single_page(mocker):
+    mock_response = json_response(
+        {
+            "results": [{"id": "1"}, {"id": "2"}],
+            "totalCount": 2,
+        }
+    )
     mock_session = MagicMock()
     mock_session.get.return_value = mock_response
     mocker.patch("get_cluster_report.get_session", return_value=mock_session)
@@ -93,8 +321,7 @@ def test_api_get_all_single_page(mocker):
 
 
 def test_api_get_all_empty(mocker):
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": [], "totalCount": 0}
+    mock_response = json_response({"results": [], "totalCount": 0})
     mock_session = MagicMock()
     mock_session.get.return_value = mock_response
     mocker.patch("get_cluster_report.get_session", return_value=mock_session)
@@ -102,6 +329,179 @@ def test_api_get_all_empty(mocker):
     assert api_get_all("/test") == []
 
 
+def test_api_get_all_multi_page_preserves_order(mocker):
+    mocker.patch("get_cluster_report.config", Config(items_per_page=2))
+
+    def fake_get(url, params=None, timeout=None):
+        page = params["pageNum"]
+        resp = json_response(
+            {
+                "results": [{"id": f"{page}a"}, {"id": f"{page}b"}][
+                    : 1 if page == 3 else 2
+                ],
+                "totalCount": 5,
+            }
+        )
+        return resp
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = fake_get
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    results = api_get_all("/test")
+    assert [r["id"] for r in results] == ["1a", "1b", "2a", "2b", "3a"]
+    assert mock_session.get.call_count == 3
+
+
+def test_api_get_pages_shared_executor(mocker):
+    mocker.patch("get_cluster_report.config", Config(items_per_page=1))
+    mocker.patch(
+        "get_cluster_report.api_get",
+        side_effect=lambda endpoint, params: {
+            "results": [{"id": params["pageNum"]}],
+            "totalCount": 3,
+        },
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        pages = dict(api_get_pages("/groups", ex=ex))
+    assert pages == {1: [{"id": 1}], 2: [{"id": 2}], 3: [{"id": 3}]}
+
+
+def run_main(mocker, argv, pages=3, per_page=100, cluster_gate=None):
+    """Run main against a stubbed api_get; return the endpoints in call order.
+
+    When ``cluster_gate`` is given, cluster fetches wait on it before returning.
+    """
+    mocker.patch("get_cluster_report.config", Config())
+    mocker.patch("get_cluster_report.ATLAS_PUBLIC_KEY", "pub")
+    mocker.patch("get_cluster_report.ATLAS_PRIVATE_KEY", "priv")
+    mocker.patch("sys.argv", ["prog", "-q", "--items-per-page", str(per_page), *argv])
+    calls, lock = [], threading.Lock()
+
+    def fake_api_get(endpoint, params=None):
+        with lock:
+            calls.append((endpoint, params.get("pageNum")))
+        if endpoint == "/groups":
+            start = (params["pageNum"] - 1) * per_page
+            return {
+                "results": [
+                    {"id": str(i), "name": f"p{i}"}
+                    for i in range(start, start + per_page)
+                ],
+                "totalCount": pages * per_page,
+            }
+        if cluster_gate is not None:
+            cluster_gate()
+        return {"results": [], "totalCount": 0}
+
+    mocker.patch("get_cluster_report.api_get", side_effect=fake_api_get)
+    main()
+    return calls
+
+
+def test_main_lists_project_pages_before_cluster_fetches(mocker, capsys):
+    calls = run_main(mocker, ["--max-workers", "4"])
+    group_idx = [i for i, (ep, _) in enumerate(calls) if ep == "/groups"]
+    # Pages 2..3 are queued ahead of page-1 cluster work, so they start
+    # within the first batch of workers rather than after 100 cluster fetches.
+    assert len(group_idx) == 3
+    assert max(group_idx) <= 4
+    assert len(calls) == 3 + 300
+    assert "Clusters: 0" in capsys.readouterr().out
+
+
+def test_main_in_flight_limit_does_not_block_listing(mocker, capsys):
+    # Cluster fetches stall until every /groups page has been filtered; a
+    # listing loop that blocks on the in-flight limit would never get there.
+    listed, stalled = threading.Event(), []
+    real_filter = filter_projects
+    pages_seen = []
+
+    def counting_filter(page):
+        pages_seen.append(page)
+        if len(pages_seen) == 3:
+            listed.set()
+        return real_filter(page)
+
+    def gate():
+        if not listed.wait(timeout=2):
+            stalled.append(True)
+            listed.set()
+
+    mocker.patch("get_cluster_report.filter_projects", side_effect=counting_filter)
+    run_main(mocker, ["--max-workers", "2"], cluster_gate=gate)
+    assert not stalled
+    assert "Projects: 300" in capsys.readouterr().out
+
+
+def test_main_caps_concurrent_requests_at_max_workers(mocker, capsys):
+    mocker.patch("get_cluster_report.config", Config())
+    mocker.patch("get_cluster_report._slots", None)
+    mocker.patch("get_cluster_report.ATLAS_PUBLIC_KEY", "pub")
+    mocker.patch("get_cluster_report.ATLAS_PRIVATE_KEY", "priv")
+    argv = ["prog", "-q", "--no-cache", "--items-per-page", "1", "--max-workers", "4"]
+    mocker.patch("sys.argv", argv)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def fake_get(url, params=None, timeout=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.005)
+        with lock:
+            active[0] -= 1
+        page = params["pageNum"]
+        if url.endswith("/groups"):
+            data = {"results": [{"id": str(page), "name": f"p{page}"}], "totalCount": 6}
+        else:
+            data = {"results": [{"name": f"c{page}"}], "totalCount": 10}
+        return json_response(data)
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = fake_get
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+    main()
+    assert "Projects: 6  |  Clusters: 60" in capsys.readouterr().out
+    assert 1 < peak[0] <= 4
+
+
+def test_fetch_project_clusters(mocker):
+    get_all = mocker.patch(
+        "get_cluster_report.api_get_all", return_value=[{"name": "c1"}]
+    )
+    rep = fetch_project_clusters({"id": "42", "name": "proj"})
+    assert rep == {"project_name": "proj", "clusters": [{"name": "c1"}]}
+    get_all.assert_called_once_with("/groups/42/clusters")
+
+
+def test_fetch_project_clusters_empty_project_served_from_cache(mocker):
+    mock_response = json_response({"results": [], "totalCount": 0})
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mocker.patch("get_cluster_report.get_session", return_value=mock_session)
+
+    p = {"id": "42", "name": "empty"}
+    assert fetch_project_clusters(p) == {"project_name": "empty", "clusters": []}
+    assert fetch_project_clusters(p) == {"project_name": "empty", "clusters": []}
+    assert mock_session.get.call_count == 1
+
+
+def test_drain_collects_results_and_failures():
+    def boom():
+        raise RuntimeError("boom")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        inflight = {
+            ex.submit(lambda: {"project_name": "ok", "clusters": []}): {"name": "ok"},
+            ex.submit(boom): {"name": "bad"},
+        }
+        reports, done = [], 0
+        while inflight:
+            done += drain(inflight, reports)
+    assert done == 2
+    assert reports == [{"project_name": "ok", "clusters": []}]
+
+
 class TestGetTier:
     def test_serverless(self):
         assert get_tier({"clusterType": "SERVERLESS"}) == "Serverless"
@@ -147,6 +547,16 @@ class TestIsLargeTier:
         assert is_large_tier("R40") is False
 
 
+class TestTierSize:
+    def test_m_series(self):
+        assert tier_size("M200") == 200
+
+    def test_other(self):
+        assert tier_size("Serverless") == 0
+        assert tier_size("R40") == 0
+        assert tier_size("N/A") == 0
+
+
 class TestInferFormat:
     def test_json(self):
         assert infer_format(Path("r.json"), None) == "json"
@@ -178,6 +588,7 @@ class TestValidateArgs:
                 max_workers=10,
                 timeout=30,
                 highlight_threshold=30,
+                cache_ttl=300,
             )
         )
 
@@ -190,6 +601,7 @@ class TestValidateArgs:
                     max_workers=10,
                     timeout=30,
                     highlight_threshold=30,
+                    cache_ttl=300,
                 )
             )
 
@@ -202,6 +614,7 @@ class TestValidateArgs:
                     max_workers=10,
                     timeout=30,
                     highlight_threshold=30,
+                    cache_ttl=300,
                 )
             )
 
@@ -214,6 +627,7 @@ class TestValidateArgs:
                     max_workers=10,
                     timeout=30,
                     highlight_threshold=30,
+                    cache_ttl=300,
                 )
             )
 
@@ -226,6 +640,20 @@ class TestValidateArgs:
                     max_workers=10,
                     timeout=0,
                     highlight_threshold=30,
+                    cache_ttl=300,
+                )
+            )
+
+    def test_cache_ttl_neg(self):
+        with pytest.raises(SystemExit):
+            validate_args(
+                argparse.Namespace(
+                    items_per_page=100,
+                    max_attempts=5,
+                    max_workers=10,
+                    timeout=30,
+                    highlight_threshold=30,
+                    cache_ttl=-1,
                 )
             )
 
@@ -238,6 +666,7 @@ class TestValidateArgs:
                     max_workers=10,
                     timeout=30,
                     highlight_threshold=-1,
+                    cache_ttl=300,
                 )
             )
 
@@ -295,6 +724,142 @@ class TestExportReport:
         assert out.exists()
 
 
+class TestFlattenReports:
+    def test_rows(self, mocker):
+        mocker.patch("get_cluster_report.config", Config(highlight_threshold=30))
+        reports = [
+            {
+                "project_name": "b",
+                "clusters": [
+                    {
+                        "name": "c1",
+                        "clusterType": "REPLICASET",
+                        "diskSizeGB": 10.0,
+                        "pitEnabled": True,
+                        "providerSettings": {
+                            "instanceSizeName": "M40",
+                            "providerName": "AWS",
+                        },
+                    }
+                ],
+            },
+            {"project_name": "a", "clusters": []},
+        ]
+        rows = flatten_reports(reports)
+        assert rows[0] == ClusterRow("a", None)
+        assert rows[1] == ClusterRow(
+            project="b",
+            name="c1",
+            tier="M40",
+            tier_size=40,
+            cluster_type="REPLICASET",
+            provider="AWS",
+            region="N/A",
+            version="N/A",
+            state="N/A",
+            pit=True,
+            disk=10.0,
+            is_large=True,
+        )
+
+    def test_empty(self):
+        assert flatten_reports([]) == []
+
+
+class TestSortRows:
+    @pytest.fixture
+    def rows(self):
+        return [
+            ClusterRow("a", "z", tier="M10", tier_size=10, disk=5.0),
+            ClusterRow("B", None),
+            ClusterRow("c", "y", tier="M40", tier_size=40, disk=50.0),
+        ]
+
+    def test_project_case_insensitive(self, rows, mocker):
+        mocker.patch("get_cluster_report.config", Config(sort_by="project"))
+        sort_rows(rows)
+        assert [r.project for r in rows] == ["a", "B", "c"]
+
+    def test_tier(self, rows, mocker):
+        mocker.patch("get_cluster_report.config", Config(sort_by="tier"))
+        sort_rows(rows)
+        assert [r.tier_size for r in rows] == [0, 10, 40]
+
+    def test_disk_descending(self, rows, mocker):
+        mocker.patch("get_cluster_report.config", Config(sort_by="disk"))
+        sort_rows(rows)
+        assert [r.disk for r in rows] == [50.0, 5.0, 0.0]
+
+    def test_cluster(self, rows, mocker):
+        mocker.patch("get_cluster_report.config", Config(sort_by="cluster"))
+        sort_rows(rows)
+        assert [r.name for r in rows] == [None, "y", "z"]
+
+
+class TestPrintReport:
+    def test_table(self, capsys, mocker):
+        mocker.patch("get_cluster_report.config", Config(force_color=True))
+        print_report(
+            [
+                ClusterRow("p1", "big", tier="M40", tier_size=40, is_large=True),
+                ClusterRow("p2", None),
+            ]
+        )
+        lines = capsys.readouterr().out.split("\n")
+        assert lines[0] == ""
+        assert lines[2].startswith("Project | Cluster")
+        assert lines[4].startswith("\x1b[91mp1") and lines[4].endswith("\x1b[0m")
+        assert "No clusters" in lines[5]
+        assert lines[-1] == ""
+
+
+class TestPrintSummary:
+    def test_counts(self, capsys):
+        print_summary(
+            [
+                ClusterRow("p1", "a", tier="M10", provider="AWS", disk=10.0),
+                ClusterRow("p1", "b", tier="M10", provider="GCP", disk=5.5),
+                ClusterRow("p2", None),
+            ],
+            2,
+        )
+        out = capsys.readouterr().out
+        assert "Projects: 2  |  Clusters: 2  |  Disk: 15.5 GB" in out
+        assert "Tiers: M10:2" in out
+        assert "Types: N/A:2" in out
+
+    def test_ties_independent_of_row_order(self, capsys):
+        rows = [
+            ClusterRow("p1", "a", tier="M30", provider="GCP", cluster_type="SHARDED"),
+            ClusterRow(
+                "p1", "b", tier="M10", provider="AWS", cluster_type="REPLICASET"
+            ),
+            ClusterRow("p2", "c", tier="M40", provider="AWS"),
+        ]
+        print_summary(rows, 2)
+        first = capsys.readouterr().out
+        print_summary(rows[::-1], 2)
+        assert capsys.readouterr().out == first
+        assert "Tiers: M10:1, M30:1, M40:1" in first
+        assert "Providers: AWS:2, GCP:1" in first
+        assert "Types: N/A:1, REPLICASET:1, SHARDED:1" in first
+
+
+class TestWriteJson:
+    def test_orjson(self):
+        pytest.importorskip("orjson")
+        buf = io.BytesIO()
+        write_json({"a": [1, "é"]}, buf)
+        assert json.loads(buf.getvalue()) == {"a": [1, "é"]}
+
+    def test_stdlib_fallback(self, mocker):
+        mocker.patch("get_cluster_report.orjson", None)
+        buf = io.BytesIO()
+        write_json({"a": [1, "é"]}, buf)
+        assert not buf.closed
+        assert json.loads(buf.getvalue()) == {"a": [1, "é"]}
+
+
 class TestConfig:
     def test_color_disabled(self):
         assert Config(no_color=True).color("\x1b[91m") == ""
@@ -345,6 +910,13 @@ class TestFilterProjects:
         mocker.patch("get_cluster_report.config", Config(include_projects=["xxx"]))
         assert len(filter_projects(projects)) == 0
 
+    def test_multiple_patterns(self, projects, mocker):
+        mocker.patch(
+            "get_cluster_report.config",
+            Config(include_projects=["dev-*", "QA-*"], exclude_projects=["x", "*-eu"]),
+        )
+        assert [p["name"] for p in filter_projects(projects)] == ["dev-us", "qa-us"]
+
     def test_exclude_all(self, projects, mocker):
         mocker.patch("get_cluster_report.config", Config(exclude_projects=["*"]))
         assert len(filter_projects(projects)) == 0